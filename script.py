@@ -1,40 +1,56 @@
 import datetime
+import os
 import re
 import sys
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
+import pythoncom # type: ignore
 import win32com.client # type: ignore
-# Ensure constants are available
-try:
-    constants = win32com.client.constants
-except AttributeError:
-    try:
-        win32com.client.gencache.EnsureModule('{00062FFF-0000-0000-C000-000000000046}', 0, 9, 6)
-        constants = win32com.client.constants
-        print("Note: Had to regenerate win32com constants cache.")
-    except Exception as e_cache:
-        print(f"FATAL: Failed to load win32com constants. Error: {e_cache}")
-        sys.exit(1)
+# Outlook enum values used per item and per save (OlObjectClass.olMail, OlSaveAsType.olMSG)
+OL_MAIL = 43
+OL_MSG = 3
+
+# Precompiled pattern and translation table used by sanitize_filename
+INVALID_CHARS_RE = re.compile(r'[<>:"/\\|?*]+')
+CONTROL_CHARS_TABLE = dict.fromkeys([*range(0x20), 0x7f])
+
+# DASL filter matching mail items (IPM.Note and variants such as IPM.Note.SMIME)
+MAIL_ITEM_FILTER = (
+    '@SQL="http://schemas.microsoft.com/mapi/proptag/0x001A001F" = \'IPM.Note\' '
+    'OR "http://schemas.microsoft.com/mapi/proptag/0x001A001F" LIKE \'IPM.Note.%\''
+)
+# Number of rows fetched per Table.GetArray call
+TABLE_BATCH_SIZE = 500
+# Number of worker threads saving .msg files concurrently
+SAVE_WORKERS = 6
+# Maximum number of saves queued at once across all workers
+MAX_PENDING_SAVES = SAVE_WORKERS * 4
+# Number of error messages kept for the end-of-run summary
+MAX_ERRORS_TO_SHOW = 20
+# Per-thread Outlook session used by save_message
+save_worker_state = threading.local()
 
 def sanitize_filename(filename):
     """Removes invalid characters for Windows filenames and limits length."""
     # Remove characters invalid in Windows filenames
-    sanitized = re.sub(r'[<>:"/\\|?*]+', '_', filename)
+    sanitized = INVALID_CHARS_RE.sub('_', filename)
     # Remove control characters
-    sanitized = re.sub(r'[\x00-\x1f\x7f]', '', sanitized)
+    sanitized = sanitized.translate(CONTROL_CHARS_TABLE)
     # Replace leading/trailing spaces or dots
     sanitized = sanitized.strip('. ')
     # Limit length to avoid issues (e.g., 150 chars)
     max_len = 150
-    if len(sanitized) > max_len:
-        name_part, dot, extension = sanitized.rpartition('.')
-        if dot:
-            name_part = name_part[:max_len - len(extension) - 1]
-            sanitized = f"{name_part}.{extension}"
-        else:
-            sanitized = sanitized[:max_len]
-    if not sanitized:
-        return "Invalid_Name"
-    return sanitized
+    if len(sanitized) <= max_len:
+        # Common case: short enough already
+        return sanitized or "Invalid_Name"
+    dot_index = sanitized.rfind('.')
+    if dot_index == -1:
+        return sanitized[:max_len]
+    extension = sanitized[dot_index + 1:]
+    name_part = sanitized[:dot_index][:max_len - len(extension) - 1]
+    return f"{name_part}.{extension}"
 
 def create_directory(path_obj):
     """Creates a directory if it doesn't exist. Returns Path object or None."""
@@ -48,120 +64,261 @@ def create_directory(path_obj):
         print(f"Unexpected error creating directory {path_obj}: {str(e)}")
         return None
 
-def list_folders_recursive(folder, prefix="", all_folders_list=None):
-    """Recursively lists folders and appends (display_name, folder_object) to a list."""
-    if all_folders_list is None:
-        all_folders_list = []
-
+def list_folders_recursive(folder, prefix=""):
+    """Recursively yields (display_name, folder_object) for a folder and its subfolders."""
     current_display_name = f"{prefix}{folder.Name}" if prefix else folder.Name
-    all_folders_list.append((current_display_name, folder))
+    yield current_display_name, folder
 
     try:
         subfolders = folder.Folders
         if subfolders.Count > 0:
             new_prefix = f"{current_display_name}/"
             for sub_folder in subfolders:
-                list_folders_recursive(sub_folder, new_prefix, all_folders_list)
+                yield from list_folders_recursive(sub_folder, new_prefix)
     except Exception as e:
         print(f"Warning: Could not access subfolders of '{folder.Name}'. Error: {e}")
 
-    return all_folders_list
 
+def read_mail_rows(folder):
+    """
+    Reads (entry_id, received_time, subject) for every mail item in a folder
+    using a single Outlook Table, fetched in batches rather than item by item.
+    Returns: (mail_rows, skipped_non_mail)
+    """
+    table = folder.GetTable(MAIL_ITEM_FILTER)
+    columns = table.Columns
+    columns.RemoveAll()
+    columns.Add("EntryID")
+    columns.Add("ReceivedTime")
+    columns.Add("Subject")
+    # Sort once up front so the store can be read in a single ordered pass
+    try:
+        table.Sort("[ReceivedTime]", True)
+    except Exception:
+        pass
+
+    mail_rows = []
+    while not table.EndOfTable:
+        batch = table.GetArray(TABLE_BATCH_SIZE)
+        if not batch:
+            break
+        mail_rows.extend(tuple(row) for row in batch)
+
+    skipped_non_mail = folder.Items.Count - len(mail_rows)
+    return mail_rows, skipped_non_mail
 
-def export_emails_as_msg(folder, output_dir_base):
+def read_mail_items(folder, record_error):
     """
-    Exports emails from a given Outlook folder as .msg files,
-    skipping if a file with the same name already exists.
-    Returns: (processed_count, errors_list, skipped_non_mail, skipped_duplicates)
+    Fallback for read_mail_rows that walks folder.Items one item at a time.
+    Returns: (mail_rows, skipped_non_mail)
+    """
+    mail_rows = []
+    all_items = folder.Items
+    # Let Outlook drop non-mail items instead of fetching each one
+    messages = all_items.Restrict(MAIL_ITEM_FILTER)
+    skipped_non_mail = all_items.Count - messages.Count
+    try:
+        messages.Sort("[ReceivedTime]", True)
+    except Exception:
+        pass
+
+    # Index the collection directly rather than going through its COM enumerator
+    total_items = messages.Count
+    for i in range(1, total_items + 1):
+        try:
+            message = messages.Item(i)
+        except Exception as e:
+            record_error(f"Error reading item at index {i}: {e}. Skipping item.")
+            continue
+
+        # Defensive check in case the filter lets through a non-mail item
+        try:
+            is_mail = message.Class == OL_MAIL
+        except Exception as e:
+            record_error(f"Error checking item type at index {i}: {e}. Skipping item.")
+            is_mail = False
+
+        if is_mail:
+            try:
+                mail_rows.append((
+                    message.EntryID,
+                    getattr(message, 'ReceivedTime', None),
+                    getattr(message, 'Subject', 'No Subject'),
+                ))
+            except Exception as e:
+                record_error(f"Error reading item at index {i}: {e}. Skipping item.")
+        else:
+            skipped_non_mail += 1
+
+        # Release the item now so Outlook can free it before the next fetch
+        message = None
+
+    return mail_rows, skipped_non_mail
+
+def save_message(entry_id, store_id, full_path):
+    """Binds an item by EntryID on the calling worker thread and saves it as .msg."""
+    # Each worker thread keeps its own MAPI session for the lifetime of the pool
+    namespace = getattr(save_worker_state, 'namespace', None)
+    if namespace is None:
+        namespace = win32com.client.Dispatch("Outlook.Application").GetNamespace("MAPI")
+        save_worker_state.namespace = namespace
+    message = namespace.GetItemFromID(entry_id, store_id)
+    message.SaveAs(full_path, OL_MSG)
+
+def release_save_worker(barrier):
+    """Drops the calling worker's Outlook session and uninitializes COM on its thread."""
+    # The barrier holds every worker busy so each thread runs this exactly once
+    try:
+        barrier.wait(timeout=60)
+    except threading.BrokenBarrierError:
+        return
+    save_worker_state.namespace = None
+    pythoncom.CoUninitialize()
+
+def shutdown_save_executor(executor):
+    """Releases the Outlook session and COM on every save worker, then shuts the pool down."""
+    barrier = threading.Barrier(SAVE_WORKERS)
+    for _ in range(SAVE_WORKERS):
+        executor.submit(release_save_worker, barrier)
+    executor.shutdown()
+
+def get_folder_output_dir(folder, output_dir_base):
+    """Returns the export directory for an Outlook folder, mirroring its path within the store."""
+    # FolderPath looks like \\Store Name\Folder\Subfolder; keep everything after the store
+    path_parts = folder.FolderPath.split('\\', 3)
+    if len(path_parts) > 3:
+        return output_dir_base / path_parts[3]
+    # Sanitize top-level folder name just in case
+    return output_dir_base / sanitize_filename(folder.Name)
+
+def export_emails_as_msg(folder, output_dir, executor, record_error):
+    """
+    Exports emails from a given Outlook folder as .msg files into output_dir,
+    which must already exist, skipping if a file with the same name already exists.
+    Saves run on executor, a pool shared across folders (see shutdown_save_executor).
+    Errors are passed to record_error as they happen.
+    Returns: (processed_count, skipped_non_mail, skipped_duplicates)
     """
     processed_count = 0
-    errors = []
+    error_count = 0
     skipped_non_mail = 0
     skipped_duplicates = 0 # <-- New counter
 
-    # Determine output directory based on folder path
-    try:
-        full_folder_path = folder.FolderPath
-        path_parts = full_folder_path.split('\\')
-        if len(path_parts) > 3:
-             relative_folder_path = Path(*path_parts[3:])
-             output_dir = create_directory(output_dir_base / relative_folder_path)
-        else:
-            # Sanitize top-level folder name just in case
-            safe_folder_name = sanitize_filename(folder.Name)
-            output_dir = create_directory(output_dir_base / safe_folder_name)
-
-        if not output_dir:
-             errors.append(f"Failed to create output directory for folder '{folder.Name}'. Skipping folder.")
-             # Return 4 values now
-             return 0, errors, 0, 0
-
-    except Exception as e:
-        errors.append(f"Error determining output path for folder '{folder.Name}': {e}. Skipping folder.")
-        # Return 4 values now
-        return 0, errors, 0, 0
+    def record_folder_error(message):
+        # Count this folder's errors for its summary line; the run-wide record is the caller's
+        nonlocal error_count
+        error_count += 1
+        record_error(message)
 
     print(f"  Exporting to: {output_dir}")
 
+    # Read existing filenames once so duplicate checks don't stat every message.
+    # Names are lowercased since Windows filenames are case-insensitive.
+    # If the listing fails, fall back to checking each file on disk.
+    check_disk = False
     try:
-        messages = folder.Items
-    except Exception as e:
-        errors.append(f"Could not retrieve items from folder '{folder.Name}': {e}")
-         # Return 4 values now
-        return 0, errors, 0, 0
-
-    total_items = len(messages) # Get total count for progress
-    print(f"    Found {total_items} items in '{folder.Name}'.")
+        with os.scandir(output_dir) as entries:
+            existing_files = {entry.name.lower() for entry in entries}
+    except OSError as e:
+        print(f"    Warning: Could not list existing files in {output_dir}: {e}")
+        existing_files = set()
+        check_disk = True
+    # Every message path shares this prefix, so build it once per folder
+    path_prefix = str(output_dir) + os.sep
 
-    for i, message in enumerate(messages):
-        # Progress indicator
-        if (i + 1) % 100 == 0: # Changed to 100 for less frequent updates
-             print(f"    Processed {i+1}/{total_items} items...")
+    try:
+        store_id = folder.StoreID
+    except Exception as e:
+        record_folder_error(f"Could not read store ID for folder '{folder.Name}': {e}. Skipping folder.")
+        return 0, 0, 0
 
-        # Check if it's a mail item
+    try:
+        mail_rows, skipped_non_mail = read_mail_rows(folder)
+    except Exception as e:
+        print(f"    Warning: Could not read item table for '{folder.Name}' ({e}). Reading items one by one.")
         try:
-            if not hasattr(message, 'Class') or message.Class != constants.olMail:
-                skipped_non_mail += 1
-                continue
+            mail_rows, skipped_non_mail = read_mail_items(folder, record_folder_error)
         except Exception as e:
-             errors.append(f"Error checking item type at index {i}: {e}. Skipping item.")
-             skipped_non_mail += 1
-             continue
+            record_folder_error(f"Could not retrieve items from folder '{folder.Name}': {e}")
+            return 0, 0, 0
 
-        try:
-            # Get timestamp for filename
-            received_time_obj = getattr(message, 'ReceivedTime', None)
-            if received_time_obj:
-                 time_str = received_time_obj.strftime("%Y-%m-%d_%H-%M-%S")
-            else:
-                time_str = "UnknownTime"
-
-            # Get subject for filename
-            subject = getattr(message, 'Subject', 'No Subject')
-            safe_subject = sanitize_filename(subject)
-
-            # Construct filename and full path object
-            filename = f"{time_str}_{safe_subject}.msg"
-            full_path_obj = output_dir / filename
+    total_items = len(mail_rows) # Get total count for progress
+    print(f"    Found {total_items} mail items in '{folder.Name}'.")
 
-            # --- Check for Duplicates ---
-            if full_path_obj.exists():
-                skipped_duplicates += 1
-                continue # Skip to the next message
-            # --- End Check ---
+    pending_saves = {}
 
-            # Save as .msg file (convert path object to string for SaveAs)
-            message.SaveAs(str(full_path_obj), constants.olMSG)
-            processed_count += 1
+    def collect_saves(done):
+        nonlocal processed_count
+        for future in done:
+            subject, time_str = pending_saves.pop(future)
+            try:
+                future.result()
+                processed_count += 1
+            except Exception as e:
+                record_folder_error(f"Error saving item '{subject}' (Time: {time_str}): {str(e)}")
 
-        except Exception as e:
-            error_subject = getattr(message, 'Subject', 'Unknown Subject')
-            error_time = time_str
-            errors.append(f"Error saving item '{error_subject}' (Time: {error_time}): {str(e)}")
-
-    print(f"  Finished folder '{folder.Name}'. Exported: {processed_count}, Skipped Duplicates: {skipped_duplicates}, Errors: {len(errors)}, Skipped non-mail: {skipped_non_mail}")
-    # Return 4 values now
-    return processed_count, errors, skipped_non_mail, skipped_duplicates
+    try:
+        for i, (entry_id, received_time_obj, subject) in enumerate(mail_rows):
+            # Progress indicator, rewritten in place on one line
+            if (i + 1) % 100 == 0: # Changed to 100 for less frequent updates
+                 sys.stdout.write(f"\r    Processed {i+1}/{total_items} items...")
+                 sys.stdout.flush()
+
+            time_str = "UnknownTime"
+            try:
+                # Get timestamp for filename (same layout as "%Y-%m-%d_%H-%M-%S", without strftime)
+                if received_time_obj:
+                    t = received_time_obj
+                    try:
+                        time_str = f"{t.year:04d}-{t.month:02d}-{t.day:02d}_{t.hour:02d}-{t.minute:02d}-{t.second:02d}"
+                    except AttributeError:
+                        time_str = "UnknownTime"
+
+                # Get subject for filename
+                safe_subject = sanitize_filename(subject or "")
+
+                # Construct filename and full path (a plain string is all SaveAs needs)
+                filename = f"{time_str}_{safe_subject}.msg"
+                full_path = path_prefix + filename
+
+                # --- Check for Duplicates ---
+                file_key = filename.lower()
+                if file_key in existing_files:
+                    is_duplicate = True
+                elif check_disk:
+                    # lexists skips the full stat() that Path.exists() performs
+                    is_duplicate = os.path.lexists(full_path)
+                else:
+                    is_duplicate = False
+                if is_duplicate:
+                    skipped_duplicates += 1
+                    continue # Skip to the next message
+                # --- End Check ---
+
+                # Reserve the name so later messages in this run don't reuse it
+                existing_files.add(file_key)
+                future = executor.submit(save_message, entry_id, store_id, full_path)
+                pending_saves[future] = (subject, time_str)
+
+            except Exception as e:
+                record_folder_error(f"Error saving item '{subject}' (Time: {time_str}): {str(e)}")
+
+            # Only keep a few saves queued per worker so cancelling stays prompt
+            if len(pending_saves) >= MAX_PENDING_SAVES:
+                done, _ = wait(pending_saves, return_when=FIRST_COMPLETED)
+                collect_saves(done)
+
+        collect_saves(wait(pending_saves).done)
+    except BaseException:
+        # Drop queued saves (e.g. on Ctrl+C) instead of finishing the whole folder
+        for future in pending_saves:
+            future.cancel()
+        raise
+
+    if total_items >= 100:
+        sys.stdout.write("\n") # End the in-place progress line
+    print(f"  Finished folder '{folder.Name}'. Exported: {processed_count}, Skipped Duplicates: {skipped_duplicates}, Errors: {error_count}, Skipped non-mail: {skipped_non_mail}")
+    return processed_count, skipped_non_mail, skipped_duplicates
 
 # --- Main Execution ---
 def main():
@@ -230,19 +387,20 @@ def main():
 
     # 4. List and Select Folders (Code is the same as before)
     print(f"\nListing folders in '{selected_store.Name}' (this may take a moment)...")
+    # Folders are printed as they are discovered rather than after the full walk
+    print("\nAvailable Folders:")
     all_folders = []
     try:
         for top_level_folder in selected_store.Folders:
-             list_folders_recursive(top_level_folder, prefix="", all_folders_list=all_folders)
+            for display_name, folder_obj in list_folders_recursive(top_level_folder):
+                all_folders.append((display_name, folder_obj))
+                print(f"  {len(all_folders)}: {display_name}")
     except Exception as e:
         print(f"Error listing folders: {e}")
         return
     if not all_folders:
         print("No folders found in the selected mailbox.")
         return
-    print("\nAvailable Folders:")
-    for i, (display_name, _) in enumerate(all_folders):
-        print(f"  {i + 1}: {display_name}")
     selected_folders_to_export = []
     while True:
         try:
@@ -254,32 +412,24 @@ def main():
             elif not choices_str:
                  print("No folders selected. Exiting.")
                  return
-            indices = [int(x.strip()) - 1 for x in choices_str.split(',')]
-            valid_indices = True
-            temp_selected_folders = []
-            selected_names = []
-            for index in indices:
-                if 0 <= index < len(all_folders):
-                    display_name, folder_obj = all_folders[index]
-                    temp_selected_folders.append(folder_obj)
-                    selected_names.append(display_name)
-                else:
-                    print(f"Invalid folder number: {index + 1}")
-                    valid_indices = False
-                    break
-            if valid_indices:
-                 selected_folders_to_export = temp_selected_folders
-                 print("\nSelected folders:")
-                 for name in selected_names:
-                      print(f"- {name}")
-                 confirm = input("Confirm selection? (y/n): ").lower()
-                 if confirm == 'y':
-                      break
-                 else:
-                      print("Selection cancelled. Please re-enter folder numbers.")
-                      selected_folders_to_export = []
+            # A set drops repeated numbers; sorting keeps the menu order
+            indices = {int(x) - 1 for x in choices_str.split(',') if x.strip()}
+            if not indices:
+                raise ValueError("no folder numbers entered")
+            invalid_numbers = sorted(index + 1 for index in indices if not 0 <= index < len(all_folders))
+            if invalid_numbers:
+                print(f"Invalid folder number(s): {', '.join(map(str, invalid_numbers))}")
+                continue
+            selected = [all_folders[index] for index in sorted(indices)]
+            print("\nSelected folders:")
+            for name, _ in selected:
+                 print(f"- {name}")
+            confirm = input("Confirm selection? (y/n): ").lower()
+            if confirm == 'y':
+                 selected_folders_to_export = [f_obj for _, f_obj in selected]
+                 break
             else:
-                 selected_folders_to_export = []
+                 print("Selection cancelled. Please re-enter folder numbers.")
         except ValueError:
             print("Invalid input. Please enter numbers separated by commas, or 'all'.")
         except Exception as e:
@@ -288,39 +438,86 @@ def main():
     # 5. Process Selected Folders
     print("\n--- Starting Export ---")
     total_processed = 0
-    total_errors = []
+    total_error_count = 0
+    total_error_samples = deque(maxlen=MAX_ERRORS_TO_SHOW)
     total_skipped_non_mail = 0
     total_skipped_duplicates = 0 # <-- New counter
 
-    for folder_obj in selected_folders_to_export:
-        # Use display name for clarity if available, otherwise folder name
-        folder_display_name = folder_obj.Name # Fallback
-        for d_name, f_obj in all_folders:
-             if f_obj == folder_obj:
-                  folder_display_name = d_name
-                  break
-        print(f"\nProcessing folder: {folder_display_name}")
-
-        # Update to receive 4 values
-        processed, errors, skipped_non_mail, skipped_duplicates = export_emails_as_msg(folder_obj, store_output_base)
-        total_processed += processed
-        total_errors.extend(errors)
-        total_skipped_non_mail += skipped_non_mail
-        total_skipped_duplicates += skipped_duplicates # <-- Accumulate count
+    # Every error is written to a log file as it happens; only samples stay in memory.
+    # Any log from a previous run is removed up front so it can't be mistaken for this
+    # run's; the new log is only created once the first error is recorded.
+    error_log_path = base_dir / "export_errors.log"
+    error_log = None
+    try:
+        error_log_path.unlink(missing_ok=True)
+    except OSError as e:
+        print(f"Warning: Could not remove previous error log {error_log_path}: {e}")
+
+    def record_error(message):
+        nonlocal total_error_count, error_log
+        total_error_count += 1
+        total_error_samples.append(message)
+        if total_error_count == 1:
+            try:
+                error_log = error_log_path.open("w", encoding="utf-8", buffering=1 << 16)
+            except OSError as e:
+                print(f"Warning: Could not open error log {error_log_path}: {e}")
+        if error_log is not None:
+            error_log.write(message + "\n")
+
+    try:
+        # Work out every target directory up front and create each unique one once
+        folders_with_dirs = []
+        created_dirs = set()
+        for folder_obj in selected_folders_to_export:
+            try:
+                output_dir = get_folder_output_dir(folder_obj, store_output_base)
+            except Exception as e:
+                record_error(f"Error determining output path for folder '{folder_obj.Name}': {e}. Skipping folder.")
+                continue
+            if output_dir not in created_dirs:
+                if not create_directory(output_dir):
+                    record_error(f"Failed to create output directory for folder '{folder_obj.Name}'. Skipping folder.")
+                    continue
+                created_dirs.add(output_dir)
+            folders_with_dirs.append((folder_obj, output_dir))
+
+        # Map folder objects to display names once, keyed by identity to avoid COM comparisons
+        display_name_by_folder = {id(f_obj): d_name for d_name, f_obj in all_folders}
+
+        # One pool of save workers (each with its own MAPI session) serves every folder
+        save_executor = ThreadPoolExecutor(max_workers=SAVE_WORKERS, initializer=pythoncom.CoInitialize)
+        try:
+            for folder_obj, output_dir in folders_with_dirs:
+                # Use display name for clarity if available, otherwise folder name
+                folder_display_name = display_name_by_folder.get(id(folder_obj))
+                if folder_display_name is None:
+                    folder_display_name = folder_obj.Name # Fallback
+                print(f"\nProcessing folder: {folder_display_name}")
+
+                processed, skipped_non_mail, skipped_duplicates = export_emails_as_msg(folder_obj, output_dir, save_executor, record_error)
+                total_processed += processed
+                total_skipped_non_mail += skipped_non_mail
+                total_skipped_duplicates += skipped_duplicates # <-- Accumulate count
+        finally:
+            shutdown_save_executor(save_executor)
+    finally:
+        if error_log is not None:
+            error_log.close()
 
     # 6. Print Summary (Updated)
     print("\n--- Export Complete ---")
     print(f"Total emails exported as .msg: {total_processed}")
     print(f"Total duplicates skipped (file already exists): {total_skipped_duplicates}") # <-- New summary line
     print(f"Total non-mail items skipped: {total_skipped_non_mail}")
-    if total_errors:
-        print(f"\nEncountered {len(total_errors)} errors during export:")
-        max_errors_to_show = 20
-        for i, error in enumerate(total_errors):
-            if i >= max_errors_to_show:
-                print(f"... (and {len(total_errors) - max_errors_to_show} more errors)")
-                break
+    if total_error_count:
+        print(f"\nEncountered {total_error_count} errors during export:")
+        if total_error_count > len(total_error_samples):
+            print(f"... ({total_error_count - len(total_error_samples)} earlier errors not shown)")
+        for error in total_error_samples:
             print(f"- {error}")
+        if error_log is not None:
+            print(f"Full error log: {error_log_path}")
     else:
         print("No errors encountered during export.")
 